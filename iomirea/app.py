@@ -17,7 +17,6 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import os
-import asyncio
 import ssl
 
 from typing import Optional
@@ -29,7 +28,7 @@ import aiohttp_remotes
 import aiohttp_session
 
 from aiohttp_session.redis_storage import RedisStorage
-from aiohttp import web
+from aiohttp import web, http_parser
 
 import middlewares
 
@@ -57,7 +56,11 @@ except ImportError:
     )
     print("Warning: Using default asyncio event loop")
 else:
-    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    uvloop.install()
+
+if http_parser.HttpRequestParser is http_parser.HttpRequestParserPy:
+    print("Warning: aiohttp C extensions are not available or disabled")
+    print("Warning: Using pure python HTTP parser")
 
 
 async def on_startup(app: web.Application) -> None:
@@ -88,7 +91,10 @@ if __name__ == "__main__":
     app["args"] = args
 
     with open(app["args"].config_file, "r") as f:
-        app["config"] = yaml.load(f, Loader=yaml.SafeLoader)
+        # use libyaml bindings if pyyaml was built with them
+        app["config"] = yaml.load(
+            f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        )
 
     app["sf_gen"] = SnowflakeGenerator(
         worker_id=int(os.environ.get("WORKER", 0)),
@@ -108,14 +114,10 @@ if __name__ == "__main__":
     app.router.add_routes(misc_routes)
 
     # API subapps
-    APIApp = web.Application(
-        middlewares=[
-            middlewares.error_handler,
-            middlewares.match_info_validator,
-        ]
-    )
+    APIApp = web.Application(middlewares=[middlewares.error_handler])
 
-    APIv0App = web.Application()
+    # only API routes have ids in path, OAuth2 requests skip this middleware
+    APIv0App = web.Application(middlewares=[middlewares.match_info_validator])
     APIv0App.add_routes(api_v0_routes)
 
     # OAuth2 subapp
@@ -175,4 +177,6 @@ if __name__ == "__main__":
         ssl_context=ssl_context,
         host=app["args"].host,
         port=app["args"].port,
+        backlog=app["args"].backlog,
+        reuse_port=app["args"].reuse_port,
     )
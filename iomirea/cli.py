@@ -58,6 +58,19 @@ argparser.add_argument(
     "-P", "--port", default="8080", help="Port to run API on. Defaults to 8080"
 )
 
+argparser.add_argument(
+    "--backlog",
+    type=int,
+    default=1024,
+    help="Maximum number of queued connections. Defaults to 1024",
+)
+
+argparser.add_argument(
+    "--reuse-port",
+    action="store_true",
+    help="allow several server processes to listen on the same port",
+)
+
 argparser.add_argument(
     "-C",
     "--config-file",
@@ -24,7 +24,7 @@ BIGINT64_MAX_POSITIVE = 9223372036854775807
 EPOCH_OFFSET = 1546300800
 EPOCH_OFFSET_MS = EPOCH_OFFSET * 1000
 
-EXISTING_SCOPES = ("user",)
+EXISTING_SCOPES = frozenset(("user",))
 
 
 class ContentType(Enum):
@@ -29,7 +29,13 @@ from log import server_log
 async def create_postgres_connection(app: aiohttp.web.Application) -> None:
     server_log.info("Creating postgres connection")
 
-    connection = await asyncpg.create_pool(**app["config"]["postgres"])
+    # pool size defaults, can be overriden in config.
+    # statements are prepared and cached per connection by asyncpg, so a
+    # bigger pool keeps more warm connections for concurrent requests
+    config = {"min_size": 10, "max_size": 50}
+    config.update(app["config"]["postgres"])
+
+    connection = await asyncpg.create_pool(**config)
 
     app["pg_conn"] = connection
 
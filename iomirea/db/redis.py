@@ -14,7 +14,10 @@ async def create_redis_pool(app: web.Application) -> None:
     host = config.pop("host")
     port = config.pop("port")
 
-    pool = await aioredis.create_pool((host, port), **config)
+    # pool size default, can be overriden in config
+    config.setdefault("maxsize", 50)
+
+    pool = await aioredis.create_redis_pool((host, port), **config)
 
     app["rd_conn"] = pool
 
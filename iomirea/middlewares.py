@@ -20,7 +20,11 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import asyncio
 import binascii
 
+from http import HTTPStatus
 from typing import Callable, Awaitable
+
+import orjson
+
 from aiohttp import web
 
 from log import server_log
@@ -29,6 +33,33 @@ from models.access_token import Token
 
 HandlerType = Callable[[web.Request], Awaitable[web.Response]]
 
+_INTERNAL_SERVER_ERROR = "500: Internal server error"
+
+
+def _encode_error(message: str) -> bytes:
+    return orjson.dumps({"message": message})
+
+
+# bodies of errors with constant messages (default HTTP exception texts and
+# internal server error) are encoded once instead of on every error
+_ERROR_BODIES = {
+    message: _encode_error(message)
+    for message in [
+        *(f"{s.value}: {s.phrase}" for s in HTTPStatus if s.value >= 400),
+        _INTERNAL_SERVER_ERROR,
+    ]
+}
+
+
+def _error_response(status: int, message: str) -> web.Response:
+    body = _ERROR_BODIES.get(message)
+    if body is None:
+        body = _encode_error(message)
+
+    return web.Response(
+        body=body, status=status, content_type="application/json"
+    )
+
 
 @web.middleware
 async def error_handler(
@@ -45,16 +76,15 @@ async def error_handler(
         if req.config_dict["args"].debug:
             raise
 
-        status = 500
-        message = f"{status} Internal server error"
+        return _error_response(500, _INTERNAL_SERVER_ERROR)
     except Exception as e:
         server_log.exception(
             "Error handling request", exc_info=e, extra={"request": req}
         )
-        status = 500
-        message = f"{status}: Internal server error"
 
-    return web.json_response({"message": message}, status=status)
+        return _error_response(500, _INTERNAL_SERVER_ERROR)
+
+    return _error_response(status, message)
 
 
 @web.middleware
@@ -29,9 +29,7 @@ class ConfirmationCode:
 
     __slots__ = ("user_id", "_code", "_conn")
 
-    def __init__(
-        self, user_id: int, code: str, conn: aioredis.ConnectionsPool
-    ):
+    def __init__(self, user_id: int, code: str, conn: aioredis.Redis):
         self.user_id = user_id
 
         self._code = code
@@ -51,7 +49,7 @@ class ConfirmationCode:
 
     @classmethod
     async def from_string(
-        cls, string: str, conn: aioredis.ConnectionsPool
+        cls, string: str, conn: aioredis.Redis
     ) -> ConfirmationCode:
         """Constructs code object from string and checks it."""
 
@@ -64,7 +62,7 @@ class ConfirmationCode:
 
     @classmethod
     async def from_data(
-        cls, user_id: int, conn: aioredis.ConnectionsPool
+        cls, user_id: int, conn: aioredis.Redis
     ) -> ConfirmationCode:
         """Constructs code object from data and saves it."""
 
@@ -46,6 +46,8 @@ OptionalInputType = typing.Optional[InputType]
 class Converter:
     """Base converter."""
 
+    __slots__ = ("_default", "_checks")
+
     ERROR_TEMPLATE = "Failed to convert parameter to {type}: {error.__class__.__name__}({error})"
     SUPPORTED_TYPES: typing.Tuple[typing.Any, ...] = (str, int, float, bool)
 
@@ -172,6 +174,8 @@ async def convert_map(
 
 
 class Integer(Converter):
+    __slots__ = ()
+
     async def _convert(
         self, value: InputType, app: aiohttp.web.Application
     ) -> int:
@@ -179,6 +183,8 @@ class Integer(Converter):
 
 
 class ID(Integer):
+    __slots__ = ()
+
     def __init__(self, **kwargs: typing.Any):
         check = checks.BetweenXAndInt64(0)
 
@@ -194,6 +200,8 @@ Snowflake = ID
 
 
 class Number(Converter):
+    __slots__ = ()
+
     async def _convert(
         self, value: InputType, app: aiohttp.web.Application
     ) -> float:
@@ -213,6 +221,8 @@ class String(Converter):
         strip_fn: string strip function to use.
     """
 
+    __slots__ = ("strip", "strip_fn")
+
     def __init__(
         self,
         strip: bool = False,
@@ -235,6 +245,8 @@ class String(Converter):
 
 
 class Boolean(Converter):
+    __slots__ = ()
+
     POSITIVE = ["1", "y", "yes", "+", "positive"]
     NEGATIVE = ["0", "n", "no", "-", "negative"]
 
@@ -262,6 +274,8 @@ class List(Converter):
     Does not support map as container yet.
     """
 
+    __slots__ = ("_converter", "_max_len")
+
     SUPPORTED_TYPES = (str, list)
 
     def __init__(
@@ -291,6 +305,8 @@ class List(Converter):
 
 
 class Map(Converter):
+    __slots__ = ("_converters",)
+
     SUPPORTED_TYPES = (dict,)
 
     def __init__(
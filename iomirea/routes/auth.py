@@ -38,6 +38,8 @@ from constants import ContentType
 
 
 class Email(converters.Converter):
+    __slots__ = ()
+
     EMAIL_REGEX = re.compile(r"[a-z0-9_.+-]+@[a-z0-9-]+\.[a-z0-9-.]+")
 
     async def _convert(self, value: str, app: web.Application) -> str:
@@ -18,7 +18,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 
 import hmac
-import base64
+import hashlib
+import struct
 import secrets
 
 from urllib.parse import urlencode
@@ -37,18 +38,28 @@ from db.postgres import APPLICATION
 
 routes = web.RouteTableDef()
 
+# auth_code record header: user id and code key. Header is followed by scope
+_AUTH_CODE_RECORD = struct.Struct("<Q20s")
+
+
+def _auth_code(key: bytes, message: str) -> str:
+    # keyed blake2b is a MAC by itself, no HMAC construction is needed
+    return hashlib.blake2b(
+        message.encode(), key=key, digest_size=20
+    ).hexdigest()
+
 
 class Scope(converters.Converter):
+    __slots__ = ()
+
     async def _convert(self, value: str, app: web.Application) -> List[str]:
-        scopes: List[str] = []
+        scopes = value.split(" ")
 
-        for i, scope in enumerate(value.split(" ")):
-            if scope not in EXISTING_SCOPES:
-                raise ValueError
-            if scope not in scopes:
-                scopes.append(scope)
+        if not EXISTING_SCOPES.issuperset(scopes):
+            raise ValueError
 
-        return scopes
+        # removes duplicates preserving order
+        return list(dict.fromkeys(scopes))
 
 
 @routes.get("/authorize")
@@ -60,7 +71,7 @@ async def authorize(
     query = req.query
 
     if "response_type" not in query:
-        return web.json_response(
+        return helpers.fast_json_response(
             {
                 "error": "invalid_request",
                 "error_description": "The request is missing a required parameter: response_type",
@@ -74,7 +85,7 @@ async def authorize(
 
         for p in ("client_id", "scope", "response_type", "redirect_uri"):
             if p not in query:
-                return web.json_response(
+                return helpers.fast_json_response(
                     {
                         "error": "invalid_request",
                         "error_description": f"The request is missing a required parameter: {p}",
@@ -84,7 +95,7 @@ async def authorize(
         try:
             scope = await Scope().convert(query["scope"], req.app)
         except ValueError:
-            return web.json_response(
+            return helpers.fast_json_response(
                 {
                     "error": "value_error",
                     "error_description": "Bad argument for parameter scope",
@@ -97,7 +108,7 @@ async def authorize(
                 query["client_id"], req.app
             )
         except ValueError:
-            return web.json_response(
+            return helpers.fast_json_response(
                 {
                     "error": "value_error",
                     "error_description": "Bad argument for parameter client_id",
@@ -111,7 +122,7 @@ async def authorize(
         )
 
         if record is None:
-            return web.json_response(
+            return helpers.fast_json_response(
                 {
                     "error": "invalid_client",
                     "error_description": "Unknown client",
@@ -120,7 +131,7 @@ async def authorize(
             )
 
         if record["redirect_uri"] != query["redirect_uri"]:
-            return web.json_response(
+            return helpers.fast_json_response(
                 {
                     "error": "error_uri",
                     "error_description": "Redirect uri does not match the client",
@@ -154,7 +165,7 @@ async def authorize(
         }
 
     elif query["response_type"] == "token":
-        return web.json_response(
+        return helpers.fast_json_response(
             {
                 "error": "unsupported_grant_type",
                 "error_description": "response_type=token is not supported yet",
@@ -163,7 +174,7 @@ async def authorize(
         )
 
     else:
-        return web.json_response(
+        return helpers.fast_json_response(
             {
                 "error": "unsupported_grant_type",
                 "error_description": "The authorization grant type is not supported by the authorization server.",
@@ -184,7 +195,7 @@ async def post_authorize(req: web.Request) -> web.Response:
     post_data = await req.post()
 
     if not post_data.get("confirm_btn"):
-        return web.json_response(
+        return helpers.fast_json_response(
             {
                 "error": "access_denied",
                 "error_description": "User has denied access",
@@ -194,15 +205,12 @@ async def post_authorize(req: web.Request) -> web.Response:
 
     message = ".".join([str(query["client_id"]), query["redirect_uri"]])
     key = secrets.token_bytes(20)
-    code = hmac.new(key, msg=message.encode(), digestmod="sha1").hexdigest()
+    code = _auth_code(key, message)
 
-    encoded_key = base64.b64encode(key).decode()
+    record = _AUTH_CODE_RECORD.pack(user_id, key) + query["scope"].encode()
 
-    await req.config_dict["rd_conn"].execute(
-        "SETEX",
-        f"auth_code:{code}",
-        10 * 60,
-        f"{user_id}:{encoded_key}:{query['scope']}",
+    await req.config_dict["rd_conn"].setex(
+        f"auth_code:{code}", 10 * 60, record
     )
 
     separator = "&" if "?" in query["redirect_uri"] else "?"
@@ -215,7 +223,7 @@ async def token(req: web.Request) -> web.Response:
     query = await req.post()  # TODO: handle errors
 
     if "grant_type" not in query:
-        return web.json_response(
+        return helpers.fast_json_response(
             {
                 "error": "invalid_request",
                 "error_description": "The request is missing a required parameter: grant_type",
@@ -229,7 +237,7 @@ async def token(req: web.Request) -> web.Response:
 
         for p in ("client_id", "code", "redirect_uri", "client_secret"):
             if p not in query:
-                return web.json_response(
+                return helpers.fast_json_response(
                     {
                         "error": "invalid_request",
                         "error_description": f"The request is missing a required parameter: {p}",
@@ -239,9 +247,15 @@ async def token(req: web.Request) -> web.Response:
 
         record_key = f"auth_code:{query['code']}"
 
-        record = await req.config_dict["rd_conn"].execute("GET", record_key)
+        # fetch and delete code in a single round trip, this also makes sure
+        # code can not be used twice by concurrent requests
+        transaction = req.config_dict["rd_conn"].multi_exec()
+        transaction.get(record_key)
+        transaction.delete(record_key)
+
+        record, _ = await transaction.execute()
         if record is None:
-            return web.json_response(
+            return helpers.fast_json_response(
                 {
                     "error": "invalid_grant",
                     "error_description": "Wrong or expired authorization code passed",
@@ -249,20 +263,14 @@ async def token(req: web.Request) -> web.Response:
                 status=400,
             )
 
-        await req.config_dict["rd_conn"].execute("DEL", record_key)
-
-        user_id, encoded_key, scope = record.decode().split(":")
-
-        user_id = int(user_id)
-        key = base64.b64decode(encoded_key)
+        user_id, key = _AUTH_CODE_RECORD.unpack_from(record)
+        scope = record[_AUTH_CODE_RECORD.size :].decode()
 
         message = ".".join([str(query["client_id"]), query["redirect_uri"]])
-        calculated_code = hmac.new(
-            key, msg=message.encode(), digestmod="sha1"
-        ).hexdigest()
+        calculated_code = _auth_code(key, message)
 
         if not hmac.compare_digest(calculated_code, query["code"]):
-            return web.json_response(
+            return helpers.fast_json_response(
                 {
                     "error": " unauthorized_client",
                     "error_description": "Bad authorization code passed",
@@ -287,7 +295,7 @@ async def token(req: web.Request) -> web.Response:
 
         # TODO: refresh_token
         # TODO: expires_in
-        return web.json_response(
+        return helpers.fast_json_response(
             {
                 "access_token": str(token),
                 "token_type": "Bearer",
@@ -295,7 +303,7 @@ async def token(req: web.Request) -> web.Response:
             }
         )
     elif query["grant_type"] == "refresh_token":
-        return web.json_response(
+        return helpers.fast_json_response(
             {
                 "error": "unsupported_grant_type",
                 "error_description": "grant_type=refresh_token is not supported yet",
@@ -304,7 +312,7 @@ async def token(req: web.Request) -> web.Response:
         )
 
     else:
-        return web.json_response(
+        return helpers.fast_json_response(
             {
                 "error": "unsupported_grant_type",
                 "error_description": "The authorization grant type is not supported by the authorization server.",
@@ -318,4 +326,4 @@ async def token(req: web.Request) -> web.Response:
 async def revoke(req: web.Request) -> web.Response:
     await req["access_token"].revoke()
 
-    return web.json_response({"message": "Deleted access token"})
+    return helpers.fast_json_response({"message": "Deleted access token"})
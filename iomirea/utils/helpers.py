@@ -32,6 +32,7 @@ from typing import (
     List,
 )
 
+import orjson
 import asyncpg
 
 from aiohttp import web
@@ -42,11 +43,18 @@ from models import converters
 from models.access_token import Token
 from enums import Permissions
 
-
 _Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
 _Decorator = Callable[[_Handler], _Handler]
 
 
+def fast_json_response(data: Any, *, status: int = 200) -> web.Response:
+    """Faster alternative to web.json_response. Encodes data with orjson."""
+
+    return web.Response(
+        body=orjson.dumps(data), status=status, content_type="application/json"
+    )
+
+
 def get_repeating(iterable: Iterable[Any]) -> Optional[Any]:
     seen: Set[Any] = set()
     for x in iterable:
@@ -147,17 +155,15 @@ def query_params(
                         reason=f"{repeating}: Repeats in query"
                     )
 
-            req["query"] = req.get("query", {})
-
             try:
-                req["query"].update(
-                    **await converters.convert_map(
-                        params, query, req.app, location="query"
-                    )
+                converted = await converters.convert_map(
+                    params, query, req.app, location="query"
                 )
             except converters.ConvertError as e:
                 return e.to_bad_request(json_response)
 
+            req.setdefault("query", {}).update(converted)
+
             return await endpoint(req)
 
         return wrapper
@@ -218,15 +224,15 @@ def body_params(
                         reason=f"{repeating}: Repeats in body"
                     )
 
-            req["body"] = req.get("body", {})
-
             try:
-                req["body"].update(
-                    **await converters.convert_map(params, query, req.app)
+                converted = await converters.convert_map(
+                    params, query, req.app
                 )
             except converters.ConvertError as e:
                 return e.to_bad_request(json_response)
 
+            req.setdefault("body", {}).update(converted)
+
             return await endpoint(req)
 
         return wrapper